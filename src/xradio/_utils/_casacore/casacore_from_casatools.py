@@ -7,13 +7,15 @@ Features:
 Note: not fully implemented; not intended to be a full API adapter layer.
 """
 
-import ast
-import inspect
+import copy
 import logging
 import os
 import shutil
+from collections.abc import Mapping, Sequence
 from functools import wraps
-from typing import Any, Dict, List, Sequence, Union
+from itertools import product
+from types import FunctionType, MethodType
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 # Configure casaconfig settings prior to casatools import
 # this ensures optimal initialization and resource allocation for casatools
@@ -92,6 +94,18 @@ def _wrap_table(swig_object: Any) -> "table":
     return table(swig_object=swig_object)
 
 
+# Concrete types accepted as sequences of row numbers or slicer indices.
+_SEQUENCE_TYPES = (list, tuple, np.ndarray)
+
+# Methods whose results never contain arrays; left unwrapped.
+_SCALAR_METHODS = frozenset(
+    {"nrows", "ncols", "name", "isopened", "iswritable", "endianformat"}
+)
+
+# Methods returning a single array (or a cell value); wrapped without recursion.
+_ARRAY_METHODS = frozenset({"getcell", "getcol", "getcolslice", "getcellslice"})
+
+
 def method_wrapper(method: Any) -> Any:
     """Wraps a method to recursively transpose NumPy array results.
 
@@ -111,9 +125,49 @@ def method_wrapper(method: Any) -> Any:
         ret = method(*args, **kwargs)
         return recursive_transpose(ret)
 
+    wrapped._xradio_wrapped = True
+    return wrapped
+
+
+def _array_method_wrapper(method: Any) -> Any:
+    """Wraps a method returning a NumPy array to transpose its result.
+
+    Non-array results, such as scalar or record cell values, fall back to
+    `recursive_transpose`.
+
+    Parameters
+    ----------
+    method : callable
+        The method to wrap.
+
+    Returns
+    -------
+    callable
+        The wrapped method.
+    """
+
+    @wraps(method)
+    def wrapped(*args, **kwargs):
+        ret = method(*args, **kwargs)
+        if type(ret) is np.ndarray:
+            return _transpose_array(ret)
+        return recursive_transpose(ret)
+
+    wrapped._xradio_wrapped = True
     return wrapped
 
 
+def _transpose_array(val: np.ndarray) -> np.ndarray:
+    """Transposes a F-contiguous NumPy array, returns any other array as is.
+
+    casatools returns arrays in F order with the axes in casacore order. The
+    transpose reverses the axes to the python-casacore order, which matters
+    even when the array is also C-contiguous (e.g. with a single non-singleton
+    axis).
+    """
+    return val.T if val.flags.f_contiguous else val
+
+
 def recursive_transpose(val: Any) -> Any:
     """Recursively transposes all NumPy arrays within the given object.
 
@@ -126,13 +180,19 @@ def recursive_transpose(val: Any) -> Any:
     -------
     Any
         The modified object with all NumPy arrays transposed.
+
+    Notes
+    -----
+    The transpose of a F-contiguous array is a C-contiguous view of the same
+    buffer, so the arrays returned are already in C order and no copy is made.
     """
-    if isinstance(val, np.ndarray) and val.flags.f_contiguous:
-        return val.T
-    elif isinstance(val, list):
-        return [recursive_transpose(item) for item in val]
-    elif isinstance(val, dict):
+    val_type = type(val)
+    if val_type is np.ndarray:
+        return _transpose_array(val)
+    elif val_type is dict:
         return {key: recursive_transpose(value) for key, value in val.items()}
+    elif val_type is list:
+        return [recursive_transpose(item) for item in val]
     else:
         return val
 
@@ -140,6 +200,12 @@ def recursive_transpose(val: Any) -> Any:
 def wrap_class_methods(cls: type) -> type:
     """Class decorator to wrap all methods of a class, including inherited ones.
 
+    The class namespaces along the MRO are walked directly, so that a method
+    overridden in a subclass shadows the inherited one. Only plain functions are
+    wrapped: dunder methods, static/class methods, builtins, methods already
+    wrapped by `method_wrapper` and methods in `_SCALAR_METHODS` are left as is.
+    Methods in `_ARRAY_METHODS` get the non-recursive `_array_method_wrapper`.
+
     Parameters
     ----------
     cls : type
@@ -150,9 +216,23 @@ def wrap_class_methods(cls: type) -> type:
     type
         The class with its methods wrapped.
     """
-    for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
-        if callable(method):
-            setattr(cls, name, method_wrapper(method))
+    seen = set()
+    for base in cls.__mro__:
+        if base is object:
+            continue
+        for name, method in list(vars(base).items()):
+            if name in seen:
+                continue
+            seen.add(name)
+            if name in _SCALAR_METHODS or getattr(method, "_xradio_wrapped", False):
+                continue
+            if isinstance(method, FunctionType) and not (
+                name.startswith("__") and name.endswith("__")
+            ):
+                if name in _ARRAY_METHODS:
+                    setattr(cls, name, _array_method_wrapper(method))
+                else:
+                    setattr(cls, name, method_wrapper(method))
     return cls
 
 
@@ -190,18 +270,23 @@ class table(casatools.table):
         tabledesc: bool = False,
         nrow: int = 0,
         readonly: bool = True,
-        lockoptions: Dict = {},
+        lockoptions: Union[Dict, None] = None,
         ack: bool = True,
-        dminfo: Dict = {},
+        dminfo: Union[Dict, None] = None,
         endian: str = "aipsrc",
         memorytable: bool = False,
-        concatsubtables: List = [],
+        concatsubtables: Union[List, None] = None,
         **kwargs,
     ):
+        if lockoptions is None:
+            lockoptions = {}
         _tablename = tablename.replace("::", "/")
         super().__init__(
             tablename=_tablename, lockoptions=lockoptions, nomodify=readonly, **kwargs
         )
+        self._readonly = readonly
+        # per-column results of _is_bulk_readable
+        self._bulk_readable = {}
 
     def __enter__(self):
         """Function to enter a with block."""
@@ -211,7 +296,9 @@ class table(casatools.table):
         """Function to exit a with block which closes the table object."""
         self.close()
 
-    def row(self, columnnames: List[str] = [], exclude: bool = False) -> "tablerow":
+    def row(
+        self, columnnames: Union[List[str], None] = None, exclude: bool = False
+    ) -> "tablerow":
         """Access rows in the table.
 
         Parameters
@@ -248,8 +335,10 @@ class table(casatools.table):
 
         This method allows the execution of a TaQL expression on the table.
         It substitutes `$mtable` and `$gtable` in the provided `taqlcommand`
-        with the current table name. A temporary copy of the table is created
-        if it is not currently opened.
+        with the current table name. If the table is not currently opened, the
+        query is run on the quoted on-disk table path, and a temporary copy of
+        the table is only created if that query fails. If the query on the copy
+        fails as well, the error of the original query is raised.
 
         Parameters
         ----------
@@ -261,6 +350,12 @@ class table(casatools.table):
         tb_query_to : object
             The result of the TaQL query as a wrapped table object.
 
+        Raises
+        ------
+        ValueError
+            If the table is not opened and its path contains both single and
+            double quotes, so that it cannot be quoted in TaQL.
+
         Notes
         -----
         For more details on TaQL, refer to:
@@ -272,23 +367,53 @@ class table(casatools.table):
         >>> print(result_table.name())
         """
         is_open = self.isopened(self.name())
-        if not is_open:
-            tablename = self.name() + "_copy"
-            tb_query_from = self.copy(tablename, deep=False, valuecopy=False)
+        if is_open:
+            tb_query_to = self._taql_on(self, self.name(), taqlcommand)
         else:
-            tablename = self.name()
-            tb_query_from = self
+            try:
+                tb_query_to = self._taql_on(
+                    self, _quote_taql_path(self.name()), taqlcommand
+                )
+            except RuntimeError as exc:
+                logger.debug(f"TaQL on table path failed, querying a copy: {exc}")
+                tablename = self.name() + "_copy"
+                tb_query_from = self.copy(tablename, deep=False, valuecopy=False)
+                try:
+                    tb_query_to = self._taql_on(tb_query_from, tablename, taqlcommand)
+                except RuntimeError:
+                    # the copy did not help (e.g. a TaQL syntax error): report the
+                    # original failure rather than the one on the temporary copy
+                    raise exc
+                finally:
+                    tb_query_from.close()
+                    shutil.rmtree(tablename)
+        logger.debug(f"tb_query_to: {tb_query_to.name()}")
+        return tb_query_to
+
+    @staticmethod
+    def _taql_on(tb_query_from: "table", tablename: str, taqlcommand: str) -> "table":
+        """Run a TaQL command with `$mtable`/`$gtable` replaced by a table name.
+
+        Parameters
+        ----------
+        tb_query_from : table
+            The table tool used to execute the query.
+        tablename : str
+            The table name (or quoted path) substituted in the command.
+        taqlcommand : str
+            The TaQL expression to execute.
+
+        Returns
+        -------
+        table
+            The result of the TaQL query as a wrapped table object.
+        """
         tb_query = taqlcommand.replace("$mtable", tablename).replace(
             "$gtable", tablename
         )
         logger.debug(f"tb_query_from: {tb_query_from.name()}")
         logger.debug(f"tb_query_cmd:  {tb_query}")
-        tb_query_to = _wrap_table(swig_object=tb_query_from._swigobj.taql(tb_query))
-        if not is_open:
-            tb_query_from.close()
-            shutil.rmtree(tablename)
-        logger.debug(f"tb_query_to: {tb_query_to.name()}")
-        return tb_query_to
+        return _wrap_table(swig_object=tb_query_from._swigobj.taql(tb_query))
 
     def getcolshapestring(self, *args, **kwargs):
         """Get the shape of table columns as string representations.
@@ -316,7 +441,7 @@ class table(casatools.table):
         ['[10, 5]', '[20, 15]']
         """
         ret = super().getcolshapestring(*args, **kwargs)
-        return [str(list(reversed(ast.literal_eval(shape)))) for shape in ret]
+        return [_reverse_shape_string(shape) for shape in ret]
 
     def getcellslice(self, columnname, rownr, blc, trc, incr=1):
         """Retrieve a sliced portion of a cell from a specified column.
@@ -329,9 +454,10 @@ class table(casatools.table):
         ----------
         columnname : str
             The name of the column from which to extract data.
-        rownr : int
-            The row number(s) from which to extract data. If a sequence is provided,
-            it is reversed before processing.
+        rownr : int or Sequence[int]
+            The row number(s) from which to extract data. A sequence of
+            consecutive row numbers is read with a single `getcolslice` call.
+            A sequence must not be empty.
         blc : Sequence[int]
             The bottom-left corner indices of the slice.
         trc : Sequence[int]
@@ -344,27 +470,58 @@ class table(casatools.table):
         Returns
         -------
         Any
-            The extracted slice from the specified column and row(s).
+            The extracted slice from the specified column and row(s), as a
+            C-contiguous array. If `rownr` is a sequence, the first axis
+            indexes the rows.
+
+        Raises
+        ------
+        ValueError
+            If `rownr` is an empty sequence.
 
         Notes
         -----
-        - If `rownr` is a sequence, it is reversed before processing.
         - The `blc`, `trc`, and `incr` parameters are converted to lists of integers.
-        - Calls the superclass method `getcellslice` for actual data retrieval.
+        - Calls the superclass method `getcellslice` for a single row, or
+          `getcolslice` for consecutive rows, for actual data retrieval.
         """
-        if isinstance(blc, Sequence):
+        rows = None
+        if isinstance(rownr, _SEQUENCE_TYPES):
+            _check_rownr(rownr)
+            rows = _contiguous_rows(rownr)
+            if rows is None:
+                # stacked in python-casacore order, so return the transpose:
+                # the method wrapper reverses the axes again
+                return np.stack(
+                    [
+                        self.getcellslice(columnname, int(irow), blc, trc, incr)
+                        for irow in rownr
+                    ]
+                ).T
+        if isinstance(blc, _SEQUENCE_TYPES):
             blc = list(map(int, blc[::-1]))
-        if isinstance(trc, Sequence):
+        if isinstance(trc, _SEQUENCE_TYPES):
             trc = list(map(int, trc[::-1]))
-        if isinstance(incr, Sequence):
-            incr = incr[::-1]
+        if isinstance(incr, _SEQUENCE_TYPES):
+            incr = list(map(int, incr[::-1]))
         else:
             incr = [incr] * len(blc)
         datatype = self.coldatatype(columnname)
 
-        ret = super().getcellslice(
-            columnname=columnname, rownr=rownr, blc=blc, trc=trc, incr=incr
-        )
+        if rows is None:
+            ret = super().getcellslice(
+                columnname=columnname, rownr=rownr, blc=blc, trc=trc, incr=incr
+            )
+        else:
+            startrow, nrow = rows
+            ret = super().getcolslice(
+                columnname=columnname,
+                blc=blc,
+                trc=trc,
+                incr=incr,
+                startrow=startrow,
+                nrow=nrow,
+            )
 
         if datatype == "float":
             return ret.astype(np.float32)
@@ -372,19 +529,23 @@ class table(casatools.table):
             return ret
 
     def putcellslice(self, columnname, rownr, value, blc, trc, incr=1):
-        """Retrieve a sliced portion of a cell from a specified column.
+        """Put a sliced portion of a cell into a specified column.
 
-        This method extracts a subarray from a cell within a table column,
+        This method writes a subarray into a cell within a table column,
         given the bottom-left corner (BLC) and top-right corner (TRC) indices.
         It also supports an optional increment (`incr`) to control step size.
 
         Parameters
         ----------
         columnname : str
-            The name of the column from which to extract data.
+            The name of the column into which to write data.
         rownr : int or Sequence[int]
-            The row number(s) from which to extract data. If a sequence is provided,
-            it is reversed before processing.
+            The row number(s) into which to write data. A sequence of
+            consecutive row numbers is written with a single `putcolslice` call,
+            in which case the first axis of `value` indexes the rows and must
+            have one entry per row number.
+        value : numpy.ndarray
+            The data to write.
         blc : Sequence[int]
             The bottom-left corner indices of the slice.
         trc : Sequence[int]
@@ -396,37 +557,57 @@ class table(casatools.table):
 
         Returns
         -------
-        Any
-            The extracted slice from the specified column and row(s).
+        None
+
+        Raises
+        ------
+        ValueError
+            If `rownr` is an empty sequence, or if the first axis of `value`
+            does not match the number of rows in `rownr`.
 
         Notes
         -----
-        - If `rownr` is a sequence, it is reversed before processing.
         - The `blc`, `trc`, and `incr` parameters are converted to lists of integers.
-        - Calls the superclass method `getcellslice` for actual data retrieval.
+        - Calls the superclass method `putcellslice` for a single row, or
+          `putcolslice` for consecutive rows, for actual data writing.
         """
-        if isinstance(rownr, Sequence):
-            rownr = rownr[::-1]
-        else:
-            rownr = [rownr] * len(blc)
-        rownr = 0
-        if isinstance(blc, Sequence):
+        rows = None
+        if isinstance(rownr, _SEQUENCE_TYPES):
+            _check_rownr(rownr, value)
+            rows = _contiguous_rows(rownr)
+            if rows is None:
+                for irow, row_value in zip(rownr, value):
+                    self.putcellslice(columnname, int(irow), row_value, blc, trc, incr)
+                return
+        if isinstance(blc, _SEQUENCE_TYPES):
             blc = list(map(int, blc[::-1]))
-        if isinstance(trc, Sequence):
+        if isinstance(trc, _SEQUENCE_TYPES):
             trc = list(map(int, trc[::-1]))
-        if isinstance(incr, Sequence):
-            incr = incr[::-1]
+        if isinstance(incr, _SEQUENCE_TYPES):
+            incr = list(map(int, incr[::-1]))
         else:
             incr = [incr] * len(blc)
 
-        super().putcellslice(
-            columnname=columnname,
-            rownr=rownr,
-            value=value.T,
-            blc=blc,
-            trc=trc,
-            incr=incr,
-        )
+        if rows is None:
+            super().putcellslice(
+                columnname=columnname,
+                rownr=rownr,
+                value=value.T,
+                blc=blc,
+                trc=trc,
+                incr=incr,
+            )
+        else:
+            startrow, nrow = rows
+            super().putcolslice(
+                columnname=columnname,
+                value=value.T,
+                blc=blc,
+                trc=trc,
+                incr=incr,
+                startrow=startrow,
+                nrow=nrow,
+            )
         return
 
     def putkeyword(
@@ -495,6 +676,144 @@ def _convert_numpy_scalars_to_native(value: Any) -> Any:
     return value
 
 
+def _quote_taql_path(path: str) -> str:
+    """Quote a table path for use as a table name in a TaQL command.
+
+    TaQL strings have no escape sequences, so the path is enclosed in the quote
+    character it does not contain.
+
+    Parameters
+    ----------
+    path : str
+        The table path.
+
+    Returns
+    -------
+    str
+        The quoted path.
+
+    Raises
+    ------
+    ValueError
+        If the path contains both single and double quotes.
+    """
+    if "'" not in path:
+        return f"'{path}'"
+    if '"' not in path:
+        return f'"{path}"'
+    raise ValueError(
+        f"Cannot quote table path {path!r} in TaQL: it contains both quote characters"
+    )
+
+
+def _reverse_shape_string(shape: str) -> str:
+    """Reverse the axes of a shape string such as `"[4, 2]"`.
+
+    Parameters
+    ----------
+    shape : str
+        The shape string as returned by `casatools`.
+
+    Returns
+    -------
+    str
+        The shape string with its axes reversed, e.g. `"[2, 4]"`.
+    """
+    return "[" + ", ".join(shape[1:-1].split(", ")[::-1]) + "]"
+
+
+def _check_rownr(rownr: Sequence[int], value: Union[np.ndarray, None] = None) -> None:
+    """Check a sequence of row numbers given to a cell slice method.
+
+    Parameters
+    ----------
+    rownr : Sequence[int]
+        The row numbers.
+    value : numpy.ndarray, optional
+        The data to write, with rows along the first axis.
+
+    Raises
+    ------
+    ValueError
+        If `rownr` is empty, or if `value` is given and its first axis does not
+        match the number of rows.
+    """
+    if len(rownr) == 0:
+        raise ValueError("rownr must contain at least one row number")
+    if value is not None and len(value) != len(rownr):
+        raise ValueError(
+            f"value has {len(value)} rows but rownr has {len(rownr)} row numbers"
+        )
+
+
+def _contiguous_rows(rownr: Sequence[int]) -> Union[Tuple[int, int], None]:
+    """Check whether a sequence of row numbers is a range of consecutive rows.
+
+    Parameters
+    ----------
+    rownr : Sequence[int]
+        The row numbers.
+
+    Returns
+    -------
+    tuple of int or None
+        The start row and the number of rows if the rows are consecutive and
+        in increasing order, otherwise None.
+    """
+    if len(rownr) == 0:
+        return None
+    startrow = int(rownr[0])
+    if any(int(irow) != startrow + idx for idx, irow in enumerate(rownr)):
+        return None
+    return startrow, len(rownr)
+
+
+def _is_bulk_readable(tb: table, columnname: str) -> bool:
+    """Check whether a column can be read for many rows with a single `getcol`.
+
+    Variable-shape array columns and record columns have no fixed cell layout
+    and must be read cell by cell. The column description is only queried the
+    first time a column is checked; the result is cached on the table.
+
+    Parameters
+    ----------
+    tb : table
+        The table containing the column.
+    columnname : str
+        The name of the column.
+
+    Returns
+    -------
+    bool
+        True if `getcol` can be used on the column.
+    """
+    bulk_readable = tb._bulk_readable.get(columnname)
+    if bulk_readable is None:
+        bulk_readable = tb._bulk_readable[columnname] = (
+            not tb.isvarcol(columnname) and tb.coldatatype(columnname) != "record"
+        )
+    return bulk_readable
+
+
+def _split_rows(values: Any) -> List[Any]:
+    """Split the result of a bulk column read into a list of per-row values.
+
+    Parameters
+    ----------
+    values : Any
+        Column values as returned by `getcol`, with rows along the first axis.
+
+    Returns
+    -------
+    list
+        The value of each row. Scalar columns give Python scalars, as `getcell`
+        does; array columns give views into `values`.
+    """
+    if isinstance(values, np.ndarray) and values.ndim == 1:
+        return values.tolist()
+    return list(values)
+
+
 @wrap_class_methods
 class image(casatools.image):
     """A Wrapper class around `casatools.image` that provides python-casacore-like methods."""
@@ -516,6 +835,8 @@ class image(casatools.image):
         super().__init__()
         self._imagename = imagename
         self._maskname = maskname
+        self._shape = None
+        self._datatype = None
         if shape is None:
             # self.open(*arg, **kwargs)
             # Add a temporary filter to the CASA instance global logger log sink filter
@@ -573,7 +894,7 @@ class image(casatools.image):
         Returns
         -------
         numpy.ndarray
-            The extracted data chunk.
+            The extracted data chunk, as a C-contiguous array.
         """
         if blc is None:
             blc = [-1]
@@ -646,7 +967,9 @@ class image(casatools.image):
         list of int
             The shape of the image, with axes reversed for consistency.
         """
-        return list(map(int, super().shape()[::-1]))
+        if self._shape is None:
+            self._shape = [int(size) for size in reversed(super().shape())]
+        return list(self._shape)
 
     def coordinates(self):
         """Get the coordinate system of the image.
@@ -714,7 +1037,9 @@ class image(casatools.image):
         return image_metadata
 
     def datatype(self):
-        return self.pixeltype()
+        if self._datatype is None:
+            self._datatype = self.pixeltype()
+        return self._datatype
 
     def _flatten_multibeam(self, imageinfo):
         """Flatten the per-plane beam information in the image metadata.
@@ -733,19 +1058,19 @@ class image(casatools.image):
             Updated `imageinfo` dictionary with flattened per-plane beam data.
         """
         if "perplanebeams" in imageinfo:
-            perplanebeams = imageinfo["perplanebeams"]["beams"]
-            perplanebeams_flat = {}
-            nchan = imageinfo["perplanebeams"]["nChannels"]
-            npol = imageinfo["perplanebeams"]["nStokes"]
-
-            for c in range(nchan):
-                for p in range(npol):
-                    k = nchan * p + c
-                    perplanebeams_flat["*" + str(k)] = perplanebeams["*" + str(c)][
-                        "*" + str(p)
-                    ]
-            imageinfo["perplanebeams"].pop("beams", None)
-            imageinfo["perplanebeams"].update(perplanebeams_flat)
+            perplanebeams = imageinfo["perplanebeams"]
+            beams = perplanebeams["beams"]
+            nchan = perplanebeams["nChannels"]
+            npol = perplanebeams["nStokes"]
+
+            c_keys = [f"*{c}" for c in range(nchan)]
+            p_keys = [f"*{p}" for p in range(npol)]
+            perplanebeams_flat = {
+                f"*{nchan * p + c}": beams[ck][pk]
+                for (c, ck), (p, pk) in product(enumerate(c_keys), enumerate(p_keys))
+            }
+            del perplanebeams["beams"]
+            perplanebeams.update(perplanebeams_flat)
 
         return imageinfo
 
@@ -759,6 +1084,26 @@ class coordinatesystem(casatools.coordsys):
             self._cs = casatools.coordsys()
         else:
             self._cs = image.coordsys()
+        self._cache = {}
+
+    def _cached(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Get a copy of a cached metadata value, fetching it on first use.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        fetch : callable
+            Function producing the value from the underlying `casatools.coordsys`.
+
+        Returns
+        -------
+        Any
+            A shallow copy of the cached value.
+        """
+        if key not in self._cache:
+            self._cache[key] = fetch()
+        return copy.copy(self._cache[key])
 
     def get_axes(self):
         """Retrieve the names of the coordinate axes.
@@ -769,11 +1114,31 @@ class coordinatesystem(casatools.coordsys):
             A list containing the names of each axis, grouped by coordinate type.
             Spectral axes are returned as a single string instead of a list.
         """
-        axes = []
+        return [
+            list(axes_list) if isinstance(axes_list, list) else axes_list
+            for axes_list in self._cached("axes", self._fetch_axes)
+        ]
+
+    def _fetch_axes(self):
+        """Fetch the names of the coordinate axes from `casatools.coordsys`.
+
+        The axis names and the pixel axes of each coordinate type are
+        retrieved once, with a single `findcoordinate` call per distinct type.
+
+        Returns
+        -------
+        list of str or list of lists
+            The axis names, as returned by `get_axes`.
+        """
         axis_names = self._cs.names()
-        for axis_type in self.get_names():
-            axis_inds = self._cs.findcoordinate(axis_type).get("pixel")
-            axes_list = [axis_names[idx] for idx in axis_inds[::-1]]
+        axis_types = self.get_names()
+        pixel_axes = {
+            axis_type: self._cs.findcoordinate(axis_type).get("pixel")
+            for axis_type in set(axis_types)
+        }
+        axes = []
+        for axis_type in axis_types:
+            axes_list = [axis_names[idx] for idx in pixel_axes[axis_type][::-1]]
             if axis_type == "spectral":
                 axes_list = axes_list[0]
             axes.append(axes_list)
@@ -787,7 +1152,9 @@ class coordinatesystem(casatools.coordsys):
         list of float
             The numeric reference pixel values, with axes reversed.
         """
-        return self._cs.referencepixel()["numeric"][::-1]
+        return self._cached(
+            "referencepixel", lambda: self._cs.referencepixel()["numeric"][::-1]
+        )
 
     def get_referencevalue(self):
         """Get the reference value at the reference pixel.
@@ -797,7 +1164,9 @@ class coordinatesystem(casatools.coordsys):
         list of float
             The numeric reference values, with axes reversed.
         """
-        return self._cs.referencevalue()["numeric"][::-1]
+        return self._cached(
+            "referencevalue", lambda: self._cs.referencevalue()["numeric"][::-1]
+        )
 
     def get_increment(self):
         """Get the coordinate increments per pixel.
@@ -807,7 +1176,7 @@ class coordinatesystem(casatools.coordsys):
         list of float
             The coordinate increment values, with axes reversed.
         """
-        return self._cs.increment()["numeric"][::-1]
+        return self._cached("increment", lambda: self._cs.increment()["numeric"][::-1])
 
     def get_unit(self):
         """Get the units of the coordinate axes.
@@ -817,7 +1186,7 @@ class coordinatesystem(casatools.coordsys):
         list of str
             The units of each axis, with axes reversed.
         """
-        return self._cs.units()[::-1]
+        return self._cached("units", lambda: self._cs.units()[::-1])
 
     def get_names(self):
         """Get the coordinate type names in lowercase.
@@ -827,7 +1196,10 @@ class coordinatesystem(casatools.coordsys):
         list of str
             The coordinate type names, with axes reversed.
         """
-        return list(map(str.lower, self._cs.coordinatetype()[::-1]))
+        return self._cached(
+            "names",
+            lambda: [name.lower() for name in reversed(self._cs.coordinatetype())],
+        )
 
     def dict(self):
         """Convert the coordinate system to a dictionary representation.
@@ -840,9 +1212,10 @@ class coordinatesystem(casatools.coordsys):
         return self._cs.torecord()
 
 
-class directioncoordinate(coordinatesystem):
+class directioncoordinate:
+    """A direction coordinate built from its coordinate system record."""
+
     def __init__(self, rec):
-        super().__init__()
         self._rec = rec
 
     def get_projection(self):
@@ -853,15 +1226,90 @@ class coordinates:
     def __init__(self):
         pass
 
-    class spectralcoordinate(coordinatesystem):
+    class spectralcoordinate:
+        """A spectral coordinate built from its coordinate system record."""
+
         def __init__(self, rec):
-            super().__init__()
             self._rec = rec
 
         def get_restfrequency(self):
             return self._rec["restfreq"]
 
 
+class _RowView(Mapping):
+    """A read-only view of one row of a `_RowSlice`.
+
+    Use `dict(row)` to get a mutable copy of the row.
+
+    Parameters
+    ----------
+    columns : dict
+        Column arrays keyed by column name, with rows along the first axis.
+    index : int
+        The index of the row in the column arrays.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], index: int):
+        self._columns = columns
+        self._index = index
+
+    def __getitem__(self, columnname: str) -> Any:
+        value = self._columns[columnname][self._index]
+        # scalar columns give Python scalars, as tablerow.get does
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class _RowSlice(Sequence):
+    """Rows of a table, stored as the column arrays read with `getcol`.
+
+    Indexing and iteration give read-only `_RowView` mappings, so that the rows
+    can be used like the list of dicts returned by `python-casacore`; slicing
+    gives another `_RowSlice`. Readers that need whole columns should use
+    `columns` instead of stacking the rows.
+
+    Parameters
+    ----------
+    columns : dict
+        Column arrays keyed by column name, with rows along the first axis.
+    nrow : int
+        The number of rows.
+
+    Attributes
+    ----------
+    columns : dict
+        Column arrays keyed by column name, with rows along the first axis.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], nrow: int):
+        self.columns = columns
+        self._nrow = nrow
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[_RowView, "_RowSlice"]:
+        if isinstance(key, slice):
+            return _RowSlice(
+                {col: values[key] for col, values in self.columns.items()},
+                len(range(self._nrow)[key]),
+            )
+        return _RowView(self.columns, range(self._nrow)[key])
+
+    def __iter__(self):
+        return (_RowView(self.columns, index) for index in range(self._nrow))
+
+    def __len__(self) -> int:
+        return self._nrow
+
+
 @wrap_class_methods
 class tablerow(casatools.tablerow):
     """A wrapper for the casatools tablerow object.
@@ -877,9 +1325,37 @@ class tablerow(casatools.tablerow):
     """
 
     def __init__(
-        self, table: table, columnnames: List[str] = [], exclude: bool = False
+        self,
+        table: table,
+        columnnames: Union[List[str], None] = None,
+        exclude: bool = False,
     ):
+        if columnnames is None:
+            columnnames = []
         super().__init__(table, columnnames=columnnames, exclude=exclude)
+        self._table = table
+        self._columnnames = (
+            [columnnames] if isinstance(columnnames, str) else list(columnnames)
+        )
+        self._exclude = exclude
+        # row count of a read-only table, filled on the first slice
+        self._nrows = None
+
+    def _get_columns(self) -> List[str]:
+        """Get the names of the columns included in the rows.
+
+        Returns
+        -------
+        list of str
+            The selected column names, in table order.
+        """
+        colnames = self._table.colnames()
+        if self._exclude:
+            return [col for col in colnames if col not in self._columnnames]
+        elif self._columnnames:
+            return [col for col in colnames if col in self._columnnames]
+        else:
+            return colnames
 
     @method_wrapper
     def get(self, rownr: int) -> Dict[str, Any]:
@@ -899,7 +1375,7 @@ class tablerow(casatools.tablerow):
 
     def __getitem__(
         self, key: Union[int, slice]
-    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], _RowSlice]:
         """Retrieve rows using indexing or slicing.
 
         Parameters
@@ -909,11 +1385,40 @@ class tablerow(casatools.tablerow):
 
         Returns
         -------
-        dict or list of dict
-            The row(s) corresponding to the key.
+        dict or list of dict or _RowSlice
+            The row for an index. For a slice, a `_RowSlice` holding the
+            column arrays when every column could be read with `getcol`,
+            otherwise the list of row dicts.
+
+        Notes
+        -----
+        For non-empty slices with a positive step, each column is read with a
+        single `getcol` call when no selected column requires cell-by-cell
+        access. Otherwise the rows are read one by one.
         """
         if isinstance(key, slice):
-            return [self.get(irow) for irow in range(*key.indices(len(self)))]
+            if self._nrows is None:
+                nrows = len(self)
+                # rows cannot be added to a read-only table: keep the count
+                if self._table._readonly:
+                    self._nrows = nrows
+            else:
+                nrows = self._nrows
+            rows = range(*key.indices(nrows))
+            if rows and rows.step > 0:
+                colnames = self._get_columns()
+                if all(_is_bulk_readable(self._table, col) for col in colnames):
+                    columns = {
+                        col: self._table.getcol(
+                            col,
+                            startrow=rows.start,
+                            nrow=len(rows),
+                            rowincr=rows.step,
+                        )
+                        for col in colnames
+                    }
+                    return _RowSlice(columns, len(rows))
+            return [self.get(irow) for irow in rows]
         elif isinstance(key, int):
             return self.get(key)
 
@@ -937,11 +1442,15 @@ class tablecolumn:
         The table object containing the column.
     _columnname : str
         The name of the column in the table.
+    _getcell : callable
+        The unwrapped casatools `getcell` method bound to the table, so that
+        `get` transposes its result only once.
     """
 
     def __init__(self, table: Any, columnname: str):
         self._table = table
         self._columnname = columnname
+        self._getcell = MethodType(casatools.table.getcell, table)
 
     @method_wrapper
     def get(self, irow: int) -> Any:
@@ -957,7 +1466,7 @@ class tablecolumn:
         Any
             The value in the specified row of the column.
         """
-        return self._table.getcell(self._columnname, irow)
+        return self._getcell(self._columnname, irow)
 
     def __getitem__(self, key: Union[int, slice]) -> Union[Any, List[Any]]:
         """Get a value or a list of values from the column using indexing or slicing.
@@ -980,9 +1489,26 @@ class tablecolumn:
         42
         >>> column[1:3]  # Get values from rows 1 to 2
         [43, 44]
+
+        Notes
+        -----
+        For slices with a positive step, the values are read with a single
+        `getcol` call unless the column requires cell-by-cell access.
         """
         if isinstance(key, slice):
-            return [self.get(irow) for irow in range(*key.indices(self._table.nrows()))]
+            rows = range(*key.indices(self._table.nrows()))
+            if not rows:
+                return []
+            if rows.step > 0 and _is_bulk_readable(self._table, self._columnname):
+                return _split_rows(
+                    self._table.getcol(
+                        self._columnname,
+                        startrow=rows.start,
+                        nrow=len(rows),
+                        rowincr=rows.step,
+                    )
+                )
+            return [self.get(irow) for irow in rows]
         elif isinstance(key, int):
             return self.get(key)
 
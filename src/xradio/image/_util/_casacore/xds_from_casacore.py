@@ -904,6 +904,8 @@ def read_generic_table(infile, subtables=False, timecols=None, ignore=None):
         mvars, mcoords, xds = {}, {}, xr.Dataset()
 
         tr = tb_tool.row(ignore, exclude=True)[:]
+        # column arrays, when the rows were read column-wise (casatools backend)
+        tr_columns = getattr(tr, "columns", {})
 
         # extract data for each col
         for col in ctype.keys():
@@ -911,7 +913,10 @@ def read_generic_table(infile, subtables=False, timecols=None, ignore=None):
                 continue  # not supported
 
             try:
-                data = np.stack([rr[col] for rr in tr])  # .astype(ctype[col].dtype)
+                if col in tr_columns:
+                    data = tr_columns[col]
+                else:
+                    data = np.stack([rr[col] for rr in tr])  # .astype(ctype[col].dtype)
                 if isinstance(tr[0][col], dict):
                     data = np.stack(
                         [
@@ -701,6 +701,8 @@ def load_generic_cols(
     col_types = find_loadable_cols(tb_tool, ignore)
 
     trows = tb_tool.row(ignore, exclude=True)[:]
+    # column arrays, when the rows were read column-wise (casatools backend)
+    trows_columns = getattr(trows, "columns", {})
 
     # Produce coords and data vars from MS columns
     mcoords, mvars = {}, {}
@@ -708,9 +710,12 @@ def load_generic_cols(
         try:
             # TODO
             # benchmark np.stack() performance
-            data = np.stack(
-                [row[col] for row in trows]
-            )  # .astype(col_cells[col].dtype)
+            if col in trows_columns:
+                data = trows_columns[col]
+            else:
+                data = np.stack(
+                    [row[col] for row in trows]
+                )  # .astype(col_cells[col].dtype)
             if isinstance(trows[0][col], dict):
                 # TODO
                 # benchmark np.stack() performance
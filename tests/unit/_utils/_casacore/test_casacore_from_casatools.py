@@ -0,0 +1,333 @@
+import os
+from collections.abc import Mapping
+from typing import Union
+
+import numpy as np
+import pytest
+
+cft = pytest.importorskip("xradio._utils._casacore.casacore_from_casatools")
+import casatools  # noqa: E402 (only available when the bridge module is)
+
+_NROW = 5
+_ID = np.arange(_NROW, dtype=np.int32)
+_UVW = np.arange(_NROW * 3, dtype=np.float64).reshape(_NROW, 3)
+_DATA = np.arange(_NROW * 2 * 4, dtype=np.float64).reshape(_NROW, 2, 4)
+# a single non-singleton axis: both C- and F-contiguous as returned by casatools
+_CHAN = np.arange(_NROW * 4, dtype=np.float64).reshape(_NROW, 1, 4)
+
+
+def _coldesc(value_type: str, shape: Union[tuple, None] = None, ndim: int = 0) -> dict:
+    """Column description for casatools.table.create, shape in python order.
+
+    Without a shape, a non-zero `ndim` gives a variable-shape array column.
+    """
+    desc = {
+        "valueType": value_type,
+        "dataManagerType": "StandardStMan",
+        "dataManagerGroup": "StandardStMan",
+        "option": 0,
+        "maxlen": 0,
+        "comment": "",
+        "keywords": {},
+    }
+    if shape is not None:
+        # Direct (1) | FixedShape (4)
+        desc.update(ndim=len(shape), shape=list(shape[::-1]), option=5)
+    elif ndim:
+        desc.update(ndim=ndim)
+    return desc
+
+
+def _var_cell(irow: int) -> np.ndarray:
+    """Value of the variable-shape column in a row."""
+    return np.arange(irow + 1, dtype=np.float64)
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    """Create a small table with scalar and fixed-shape array columns."""
+    path = str(tmp_path / "test_table.tab")
+    tb = casatools.table()
+    tb.create(
+        path,
+        {
+            "ID": _coldesc("int"),
+            "UVW": _coldesc("double", (3,)),
+            "DATA": _coldesc("double", (2, 4)),
+            "CHAN": _coldesc("double", (1, 4)),
+            "VAR": _coldesc("double", ndim=1),
+        },
+        nrow=_NROW,
+    )
+    # casatools takes F-order arrays, with rows along the last axis
+    tb.putcol("ID", _ID)
+    tb.putcol("UVW", _UVW.T)
+    tb.putcol("DATA", _DATA.T)
+    tb.putcol("CHAN", _CHAN.T)
+    for irow in range(_NROW):
+        tb.putcell("VAR", irow, _var_cell(irow))
+    tb.close()
+    return path
+
+
+def test_tablecolumn_int_index(table_path):
+    with cft.table(table_path) as tb:
+        np.testing.assert_array_equal(tb.col("UVW")[2], _UVW[2])
+        np.testing.assert_array_equal(tb.col("DATA")[3], _DATA[3])
+        chan = tb.col("CHAN")[3]
+    assert chan.shape == _CHAN[3].shape
+    np.testing.assert_array_equal(chan, _CHAN[3])
+
+
+@pytest.mark.parametrize(
+    "key", [slice(None), slice(1, 4), slice(0, 5, 2), slice(4, 0, -1)]
+)
+def test_tablecolumn_slice(table_path, key):
+    with cft.table(table_path) as tb:
+        uvw = tb.col("UVW")[key]
+        data = tb.col("DATA")[key]
+        chan = tb.col("CHAN")[key]
+    rows = range(_NROW)[key]
+    assert len(uvw) == len(data) == len(chan) == len(rows)
+    for irow, uvw_row, data_row, chan_row in zip(rows, uvw, data, chan):
+        np.testing.assert_array_equal(uvw_row, _UVW[irow])
+        np.testing.assert_array_equal(data_row, _DATA[irow])
+        assert chan_row.shape == _CHAN[irow].shape
+        np.testing.assert_array_equal(chan_row, _CHAN[irow])
+
+
+@pytest.mark.parametrize("column", ["UVW", "DATA", "CHAN"])
+def test_tablecolumn_slice_one_row(table_path, column):
+    expected = {"UVW": _UVW, "DATA": _DATA, "CHAN": _CHAN}[column]
+    with cft.table(table_path) as tb:
+        values = tb.col(column)[2:3]
+    assert len(values) == 1
+    assert values[0].shape == expected[2].shape
+    np.testing.assert_array_equal(values[0], expected[2])
+
+
+def test_tablecolumn_slice_scalar_column(table_path):
+    with cft.table(table_path) as tb:
+        values = tb.col("ID")[1:3]
+    assert values == [1, 2]
+    assert all(type(value) is int for value in values)
+
+
+def _spy_taql_on(monkeypatch, tb) -> list:
+    """Record the table name and error of each TaQL query run by `tb`.
+
+    The table is also made to look closed, so that `taql` queries its path.
+    """
+    calls = []
+
+    def taql_on(tb_query_from, tablename, taqlcommand):
+        try:
+            ret = cft.table._taql_on(tb_query_from, tablename, taqlcommand)
+        except RuntimeError as exc:
+            calls.append((tablename, exc))
+            raise
+        calls.append((tablename, None))
+        return ret
+
+    monkeypatch.setattr(tb, "isopened", lambda tablename: False)
+    monkeypatch.setattr(tb, "_taql_on", taql_on)
+    return calls
+
+
+def test_taql_on_table_path(monkeypatch, table_path):
+    with cft.table(table_path) as tb:
+        calls = _spy_taql_on(monkeypatch, tb)
+        result = tb.taql("SELECT ID FROM $mtable WHERE ID > 2")
+        nrows = result.nrows()
+        result.close()
+    assert nrows == 2
+    assert calls == [(f"'{table_path}'", None)]
+    assert not os.path.exists(table_path + "_copy")
+
+
+def test_taql_reraises_original_error(monkeypatch, table_path):
+    with cft.table(table_path) as tb:
+        calls = _spy_taql_on(monkeypatch, tb)
+        with pytest.raises(RuntimeError) as excinfo:
+            tb.taql("SELEC ID FROM $mtable")
+    # the query is retried on a temporary copy, which is removed afterwards
+    assert [tablename for tablename, _ in calls] == [
+        f"'{table_path}'",
+        table_path + "_copy",
+    ]
+    assert all(exc is not None for _, exc in calls)
+    assert excinfo.value is calls[0][1]
+    assert not os.path.exists(table_path + "_copy")
+
+
+@pytest.mark.parametrize(
+    "path, quoted",
+    [
+        ("/data/vis.ms", "'/data/vis.ms'"),
+        ("/data/o'brien.ms", '"/data/o\'brien.ms"'),
+        ('/data/"vis".ms', "'/data/\"vis\".ms'"),
+    ],
+)
+def test_quote_taql_path(path, quoted):
+    assert cft._quote_taql_path(path) == quoted
+
+
+def test_quote_taql_path_both_quotes():
+    with pytest.raises(ValueError, match="both quote characters"):
+        cft._quote_taql_path('/data/o\'brien "vis".ms')
+
+
+_BLC = (0, 1)
+_TRC = (1, 2)
+_CELL_SLICE = (slice(0, 2), slice(1, 3))
+
+_ROWNRS = [3, [1, 2, 3], [4, 0, 2], np.array([1, 2])]
+
+
+@pytest.mark.parametrize("rownr", _ROWNRS)
+def test_getcellslice(table_path, rownr):
+    with cft.table(table_path) as tb:
+        data = tb.getcellslice("DATA", rownr, _BLC, _TRC)
+    expected = _DATA[(rownr,) + _CELL_SLICE]
+    assert data.shape == expected.shape
+    np.testing.assert_array_equal(data, expected)
+
+
+@pytest.mark.parametrize("rownr", _ROWNRS)
+def test_putcellslice(table_path, rownr):
+    expected = _DATA.copy()
+    value = -np.arange(expected[(rownr,) + _CELL_SLICE].size, dtype=np.float64)
+    value = value.reshape(expected[(rownr,) + _CELL_SLICE].shape)
+    expected[(rownr,) + _CELL_SLICE] = value
+    with cft.table(table_path, readonly=False) as tb:
+        tb.putcellslice("DATA", rownr, value, _BLC, _TRC)
+    with cft.table(table_path) as tb:
+        data = tb.getcol("DATA")
+    # only the requested rows are written (row 0 used to be written instead)
+    np.testing.assert_array_equal(data, expected)
+
+
+def test_getcellslice_empty_rows(table_path):
+    with cft.table(table_path) as tb:
+        with pytest.raises(ValueError, match="at least one row"):
+            tb.getcellslice("DATA", [], _BLC, _TRC)
+
+
+@pytest.mark.parametrize("rownr", [[1, 2, 3], [4, 0, 2]])
+def test_putcellslice_row_count_mismatch(table_path, rownr):
+    value = np.zeros((len(rownr) - 1, 2, 2))
+    with cft.table(table_path, readonly=False) as tb:
+        with pytest.raises(ValueError, match="rows but rownr has"):
+            tb.putcellslice("DATA", rownr, value, _BLC, _TRC)
+        data = tb.getcol("DATA")
+    np.testing.assert_array_equal(data, _DATA)
+
+
+@pytest.fixture
+def row_slice():
+    return cft._RowSlice({"A": np.array([1, 2, 3]), "B": np.array(["x", "y", "z"])}, 3)
+
+
+def test_rowslice_indexing(row_slice):
+    assert len(row_slice) == 3
+    assert isinstance(row_slice[0], Mapping)
+    assert row_slice[0]["A"] == 1
+    assert type(row_slice[0]["A"]) is int
+    assert type(row_slice[0]["B"]) is str
+    assert row_slice[-1]["B"] == "z"
+    assert dict(row_slice[1]) == {"A": 2, "B": "y"}
+    assert list(row_slice[1]) == ["A", "B"]
+    with pytest.raises(IndexError):
+        row_slice[3]
+    with pytest.raises(KeyError):
+        row_slice[0]["C"]
+    with pytest.raises(TypeError):
+        row_slice[0]["A"] = 0
+
+
+def test_rowslice_iteration(row_slice):
+    assert [row["A"] for row in row_slice] == [1, 2, 3]
+    assert [dict(row) for row in row_slice] == [
+        {"A": 1, "B": "x"},
+        {"A": 2, "B": "y"},
+        {"A": 3, "B": "z"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "key", [slice(1, None), slice(None, None, -1), slice(0, 3, 2), slice(5, None)]
+)
+def test_rowslice_slicing(row_slice, key):
+    sliced = row_slice[key]
+    assert isinstance(sliced, cft._RowSlice)
+    assert len(sliced) == len(range(3)[key])
+    assert [row["A"] for row in sliced] == [1, 2, 3][key]
+    assert [row["B"] for row in sliced] == ["x", "y", "z"][key]
+
+
+@pytest.mark.parametrize(
+    "columnnames, exclude",
+    # without VAR every column is read with getcol, with VAR row by row
+    [(["VAR"], True), ([], False), (["ID", "VAR"], False)],
+)
+@pytest.mark.parametrize("key", [slice(1, 4), slice(None), slice(4, None, -2)])
+def test_tablerow_slice(table_path, columnnames, exclude, key):
+    with cft.table(table_path) as tb:
+        rows = tb.row(columnnames, exclude=exclude)[key]
+        single_rows = [
+            tb.row(columnnames, exclude=exclude)[irow] for irow in range(_NROW)[key]
+        ]
+    bulk = exclude and key.step is None
+    assert isinstance(rows, cft._RowSlice if bulk else list)
+    assert len(rows) == len(single_rows)
+    for row, single_row in zip(rows, single_rows):
+        assert isinstance(row, Mapping)
+        assert set(row) == set(single_row)
+        for col, value in single_row.items():
+            assert type(row[col]) is type(value)
+            np.testing.assert_array_equal(row[col], value)
+
+
+def test_tablerow_slice_columns(table_path):
+    with cft.table(table_path) as tb:
+        rows = tb.row(["VAR"], exclude=True)[1:4]
+    assert set(rows.columns) == {"ID", "UVW", "DATA", "CHAN"}
+    for col, expected in [("ID", _ID), ("UVW", _UVW), ("DATA", _DATA), ("CHAN", _CHAN)]:
+        assert isinstance(rows.columns[col], np.ndarray)
+        assert rows.columns[col].shape == expected[1:4].shape
+        np.testing.assert_array_equal(rows.columns[col], expected[1:4])
+
+
+def test_tablerow_slice_values(table_path):
+    with cft.table(table_path) as tb:
+        rows = tb.row()[1:3]
+    for irow, row in zip(range(1, 3), rows):
+        assert row["ID"] == _ID[irow]
+        np.testing.assert_array_equal(row["UVW"], _UVW[irow])
+        np.testing.assert_array_equal(row["DATA"], _DATA[irow])
+        assert row["CHAN"].shape == _CHAN[irow].shape
+        np.testing.assert_array_equal(row["CHAN"], _CHAN[irow])
+        np.testing.assert_array_equal(row["VAR"], _var_cell(irow))
+
+
+def test_tablerow_slice_empty(table_path):
+    with cft.table(table_path) as tb:
+        rows = tb.row(["ID"])[3:3]
+    assert rows == []
+
+
+@pytest.mark.parametrize("shape", [(2, 3, 4), (1, 3, 1), (1, 1, 5)])
+def test_image_getdata(tmp_path, shape):
+    path = str(tmp_path / "test.im")
+    pixels = np.arange(np.prod(shape), dtype=np.float64).reshape(shape)
+    ia = casatools.image()
+    # casatools takes F-order arrays with the axes in casacore order
+    ia.fromarray(path, pixels=pixels.T, overwrite=True)
+    ia.done()
+    img = cft.image(path)
+    data = img.getdata()
+    del img
+    assert data.shape == shape
+    assert data.dtype == np.float32
+    assert data.flags.c_contiguous
+    np.testing.assert_array_equal(data, pixels)